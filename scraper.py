@@ -1,10 +1,19 @@
 import os
 import sys
 import signal
-import time
+import re
+import sqlite3
 import logging
-import pandas as pd
-from openpyxl import load_workbook
+import threading
+import queue
+from multiprocessing import Manager
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -14,11 +23,72 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    NoSuchElementException, SessionNotCreatedException, StaleElementReferenceException, TimeoutException,
+)
 
 # --- Configuration ---
 LOG_FILE = "scraping_log.txt"
 EXCEL_FILE = "delaware_all_bids.xlsx"
+# Sidecar database of already scraped Bid IDs, checked instead of re-reading the Excel file.
+# It belongs to EXCEL_FILE: named after it, and reset when the workbook is missing
+PROCESSED_IDS_DB = os.path.splitext(EXCEL_FILE)[0] + ".processed_ids.db"
+# Scraped bids wait in a bounded queue for the background Excel writer, which
+# saves the workbook every SAVE_EVERY_ROWS rows
+WRITE_QUEUE_SIZE = 200
+SAVE_EVERY_ROWS = 50
+# Seconds to wait for room in the queue when telling the writer to stop
+WRITER_STOP_TIMEOUT = 60
 BASE_URL = "https://mmp.delaware.gov/Bids/"
+# Summary columns of the bids grid, in the order they are rendered
+GRID_COLUMNS = ["Bid ID", "Contract Number", "Title", "Open Date", "Deadline", "Agency", "UNSPSC"]
+# Sites to scrape, each with its bid categories as (name, tab button id);
+# every category is scraped in its own browser process
+SITES = [
+    {
+        "url": BASE_URL,
+        "categories": [("Open", "btnOpen"), ("Recently Closed", "btnClosed"), ("Not Awarded", "btnNotAwarded")],
+    },
+]
+# Categories listed newest first: once a whole page is already scraped, the
+# following pages only hold older bids, so an incremental run can stop there
+CHRONOLOGICAL_CATEGORIES = {"Open", "Recently Closed"}
+# Browser tabs per category; detail modals load in the other tabs while one is being scraped
+TABS_PER_CATEGORY = 4
+# Static resources the scraper never reads; blocked to speed up page loads.
+# Stylesheets are kept: the modal visibility waits depend on them.
+BLOCKED_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.woff", "*.woff2", "*.ttf", "*.eot"]
+# Set to True to also download each bid's documents into DOCUMENTS_DIR/<Bid ID>/
+DOWNLOAD_DOCUMENTS = False
+DOCUMENTS_DIR = "bid_documents"
+DOWNLOAD_WORKERS = 10
+# Persistent Chrome profiles, one per category worker (Chrome locks a profile
+# to a single instance), so the HTTP cache survives between runs
+CHROME_PROFILE_DIR = ".chrome_profile"
+CHROME_DISK_CACHE_SIZE = 100 * 1024 * 1024
+# Resolved chromedriver path, cached so later runs skip webdriver_manager's update check
+DRIVER_PATH_FILE = ".driver_path"
+# Seconds driver.get() may block before giving up on slow third-party resources
+PAGE_LOAD_TIMEOUT = 30
+
+# --- Selectors ---
+# Built once and shared by the hot loops; the CSS strings are also passed to
+# the page scripts, so each selector is maintained in one place
+_SEL_DATA_ROWS = (By.CSS_SELECTOR, "#jqGridBids tbody tr.jqgrow")
+_SEL_MODAL = (By.ID, "dynamicDialogInnerHtml")
+_SEL_NEXT = (By.ID, "next_jqg1")
+
+# Shared HTTP session for this process: grid requests and document downloads
+# reuse its pooled keep-alive connections instead of a new TLS handshake each
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=20, pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+
+# Document download pool for this process, created on first use and kept for
+# the whole category so downloads run in the background of the modal pipeline
+_download_executor = None
 
 # --- Main ---
 
@@ -27,16 +97,18 @@ def main():
     Main function to orchestrate the web scraping process.
     """
     setup_logging()
-    driver = initialize_browser()
-    setup_interrupt_handler(driver)
-
+    get_driver_path()  # Resolve once here so the category workers all hit the cache
+    if not os.path.exists(EXCEL_FILE) and os.path.exists(PROCESSED_IDS_DB):
+        # A new workbook must not inherit the bids recorded for a deleted or moved one
+        logging.info(f"{EXCEL_FILE} not found; resetting {PROCESSED_IDS_DB}.")
+        os.remove(PROCESSED_IDS_DB)
+    conn = open_processed_ids_db(PROCESSED_IDS_DB)
     try:
-        processed_bid_ids = load_processed_bid_ids(EXCEL_FILE)
-        navigate_to_bids_page(driver, BASE_URL)
-        process_bid_categories(driver, processed_bid_ids)
+        seed_processed_ids(conn, EXCEL_FILE)
     finally:
-        driver.quit()
-        logging.info("Scraping complete and browser closed.")
+        conn.close()
+    process_bid_categories()
+    logging.info("Scraping complete.")
 
 # --- Setup and Configuration ---
 
@@ -53,16 +125,71 @@ def setup_logging():
         ]
     )
 
-def initialize_browser():
+def initialize_browser(profile_name="default"):
     """
     Initializes and returns a Selenium Chrome WebDriver with specified options.
+    The browser uses the persistent profile CHROME_PROFILE_DIR/<profile_name>,
+    so static assets are served from its disk cache on later runs.
     """
     options = Options()
     options.add_argument("--headless")  # Uncomment to run in the background
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920x1080")
-    service = Service(ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=options)
+    # Return from driver.get() at DOMContentLoaded; the grid waits cover the rest
+    options.page_load_strategy = "eager"
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument(f"--user-data-dir={os.path.abspath(os.path.join(CHROME_PROFILE_DIR, profile_name))}")
+    options.add_argument(f"--disk-cache-size={CHROME_DISK_CACHE_SIZE}")
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    try:
+        driver = webdriver.Chrome(service=Service(get_driver_path()), options=options)
+    except SessionNotCreatedException as e:
+        # Only a driver/browser version mismatch is fixed by a new driver; other
+        # failures (e.g. a profile still locked by a crashed run) are raised
+        if "only supports Chrome version" not in str(e):
+            raise
+        logging.warning(f"Cached chromedriver doesn't match Chrome, refreshing it: {e}")
+        driver = webdriver.Chrome(service=Service(get_driver_path(refresh=True)), options=options)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+
+    # Block images and fonts at the network level as well
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+    return driver
+
+def get_profile_name(url, tab_id):
+    """
+    Returns the browser profile name of a category worker. It is keyed by the
+    site as well as the tab, since sites may reuse the same tab button ids and
+    two workers can't share one Chrome profile.
+    """
+    site = re.sub(r"\W+", "_", url.split("://", 1)[-1]).strip("_")
+    return f"{site}_{tab_id}"
+
+def get_driver_path(refresh=False):
+    """
+    Returns the chromedriver path cached in DRIVER_PATH_FILE. Falls back to
+    webdriver_manager (which checks for updates over the network and may
+    download a driver) only if the cache is missing, the driver is gone or
+    refresh is set because the cached driver no longer matches Chrome.
+    """
+    if not refresh and os.path.exists(DRIVER_PATH_FILE):
+        with open(DRIVER_PATH_FILE) as f:
+            path = f.read().strip()
+        if path and os.path.exists(path):
+            return path
+
+    path = ChromeDriverManager().install()
+    # Write through a temporary file so parallel workers never read a partial path
+    temp_file = f"{DRIVER_PATH_FILE}.{os.getpid()}.tmp"
+    with open(temp_file, "w") as f:
+        f.write(path)
+    os.replace(temp_file, DRIVER_PATH_FILE)
+    return path
 
 def setup_interrupt_handler(driver):
     """
@@ -75,187 +202,756 @@ def setup_interrupt_handler(driver):
         sys.exit()
     signal.signal(signal.SIGINT, handle_interrupt)
 
+# --- Processed Bid IDs ---
+
+def open_processed_ids_db(db_file):
+    """
+    Opens the sqlite database of already scraped Bid IDs, creating it if needed.
+    """
+    conn = sqlite3.connect(db_file)
+    conn.execute("CREATE TABLE IF NOT EXISTS ids(bid_id TEXT PRIMARY KEY)")
+    conn.execute("CREATE TABLE IF NOT EXISTS walks(walk_id TEXT PRIMARY KEY)")
+    return conn
+
+def seed_processed_ids(conn, excel_file):
+    """
+    Fills an empty database from the Bid IDs in the Excel file, so bids scraped
+    before the database existed are not scraped again.
+    """
+    if conn.execute("SELECT 1 FROM ids LIMIT 1").fetchone() is None:
+        mark_bids_processed(conn, load_processed_bid_ids(excel_file))
+
+def is_bid_processed(conn, bid_id):
+    """
+    Checks whether a Bid ID was already scraped, using the primary key index.
+    """
+    return conn.execute("SELECT 1 FROM ids WHERE bid_id=?", (str(bid_id),)).fetchone() is not None
+
+def mark_bids_processed(conn, bid_ids):
+    """
+    Records a batch of scraped Bid IDs in a single transaction.
+    """
+    conn.executemany("INSERT OR IGNORE INTO ids VALUES(?)", [(str(bid_id),) for bid_id in bid_ids])
+    conn.commit()
+
+def start_category_walk(conn, walk_id):
+    """
+    Clears the completion marker of a category walk and returns whether the
+    previous walk reached the end of the table. Until the new walk completes,
+    an interrupted run leaves older pages unscraped, so they must be walked again.
+    """
+    completed = conn.execute("SELECT 1 FROM walks WHERE walk_id=?", (walk_id,)).fetchone() is not None
+    conn.execute("DELETE FROM walks WHERE walk_id=?", (walk_id,))
+    conn.commit()
+    return completed
+
+def complete_category_walk(conn, walk_id):
+    """
+    Records that a category walk reached the end of the table.
+    """
+    conn.execute("INSERT OR IGNORE INTO walks VALUES(?)", (walk_id,))
+    conn.commit()
+
 # --- Excel File Handling ---
 
 def load_processed_bid_ids(excel_file):
     """
-    Loads a set of already processed Bid IDs from the specified Excel file
-    to prevent duplicate scraping.
+    Loads a set of already processed Bid IDs from the specified Excel file.
+    Only used to seed the processed-IDs database on its first run. The sheet is
+    streamed in read-only mode and only the "Bid ID" column is kept.
     """
     if not os.path.exists(excel_file):
         logging.info(f"No existing Excel file found. \nStarting fresh.")
         return set()
 
     try:
-        df_existing = pd.read_excel(excel_file)
-        if "Bid ID" in df_existing.columns:
-            processed_ids = set(df_existing["Bid ID"].astype(str))
+        book = load_workbook(excel_file, read_only=True, data_only=True)
+        try:
+            rows = book.active.iter_rows(values_only=True)
+            headers = next(rows, ())
+            if "Bid ID" not in headers:
+                logging.warning("Column 'Bid ID' not found in Excel. Starting with an empty set.")
+                return set()
+
+            index = headers.index("Bid ID")
+            processed_ids = {str(row[index]) for row in rows if len(row) > index and row[index] is not None}
             logging.info(f"Loaded {len(processed_ids)} previously scraped bid IDs.")
             return processed_ids
-        else:
-            logging.warning("Column 'Bid ID' not found in Excel. Starting with an empty set.")
-            return set()
+        finally:
+            book.close()
     except Exception as e:
         logging.error(f"Error reading Excel file: {e}")
         return set()
 
-def append_to_excel(bid_data, excel_file):
+def open_workbook(excel_file):
     """
-    Appends a new row of bid data to the Excel file. Creates the file with headers
-    if it doesn't exist.
+    Loads the Excel file for appending, or starts a new workbook if it doesn't exist.
+    Returns (book, sheet, headers); headers is None for a new workbook until
+    its first row is written.
     """
-    df_row = pd.DataFrame([bid_data])
-    if not os.path.exists(excel_file):
-        df_row.to_excel(excel_file, index=False)
-        logging.info("Created new Excel file with headers.")
+    if os.path.exists(excel_file):
+        book = load_workbook(excel_file)
+        sheet = book.active
+        return book, sheet, [cell.value for cell in sheet[1]]
+
+    book = Workbook()
+    return book, book.active, None
+
+def excel_writer(row_queue, book, sheet, headers, excel_file, db_file):
+    """
+    Background thread that appends queued bids to the open workbook, so disk
+    I/O overlaps with scraping. The workbook is saved every SAVE_EVERY_ROWS rows
+    and once more when the None sentinel arrives. Errors are logged per row, so
+    the thread keeps draining the queue until the sentinel; a dead writer would
+    leave the workers blocked on a full queue.
+    """
+    conn = open_processed_ids_db(db_file)
+    unsaved_ids = []
+    while True:
+        bid = row_queue.get()
+        if bid is None:
+            break
+
+        try:
+            if headers is None:
+                headers = list(bid)
+                sheet.append(headers)
+                logging.info("Created new Excel file with headers.")
+
+            # Append without writing headers again, matching values to the existing columns
+            append_bid_row(sheet, headers, bid)
+            unsaved_ids.append(bid["Bid ID"])
+            if len(unsaved_ids) >= SAVE_EVERY_ROWS:
+                save_workbook(book, excel_file, conn, unsaved_ids)
+        except Exception as e:
+            logging.error(f"Failed to write Bid ID {bid.get('Bid ID')} to Excel: {e}")
+
+    try:
+        save_workbook(book, excel_file, conn, unsaved_ids)
+    except Exception as e:
+        logging.error(f"Failed to save data to Excel: {e}")
+    finally:
+        conn.close()
+
+def append_bid_row(sheet, headers, bid):
+    """
+    Appends one bid as a sheet row. Control characters that Excel can't store
+    are removed, and a row that still fails half-way is taken out again.
+    """
+    values = []
+    for header in headers:
+        value = bid.get(header)
+        if isinstance(value, str):
+            value = ILLEGAL_CHARACTERS_RE.sub("", value)
+        values.append(value)
+
+    last_row = sheet.max_row
+    try:
+        sheet.append(values)
+    except Exception:
+        if sheet.max_row > last_row:
+            sheet.delete_rows(sheet.max_row)
+        raise
+
+def save_workbook(book, excel_file, conn, unsaved_ids):
+    """
+    Saves the workbook and records the Bid IDs saved since the last save as
+    processed. On failure the IDs are kept, to be retried with the next save.
+    """
+    if not unsaved_ids:
         return
 
     try:
-        book = load_workbook(excel_file)
-        sheet = book.active
-        # Append without writing headers again
-        with pd.ExcelWriter(excel_file, engine='openpyxl', mode='a', if_sheet_exists='overlay') as writer:
-            df_row.to_excel(writer, index=False, header=False, startrow=sheet.max_row)
+        book.save(excel_file)
     except PermissionError:
         logging.error(f"Permission denied: Could not write to '{excel_file}'. It may be open.")
+        return
     except Exception as e:
         logging.error(f"Failed to save data to Excel: {e}")
+        return
+
+    mark_bids_processed(conn, unsaved_ids)
+    logging.info(f"Saved {len(unsaved_ids)} new bids to '{excel_file}'.")
+    unsaved_ids.clear()
 
 # --- Web Scraping Logic ---
 
 def navigate_to_bids_page(driver, url):
     """
-    Navigates the browser to the specified URL.
+    Navigates the browser to the specified URL. A page load that hangs on a
+    slow resource is stopped; the table waits that follow decide whether the
+    page is usable.
     """
-    driver.get(url)
+    try:
+        driver.get(url)
+    except TimeoutException:
+        logging.warning(f"Page load of {url} timed out. Stopping it and continuing.")
+        driver.execute_script("window.stop();")
     logging.info(f"Navigated to {url}")
 
-def process_bid_categories(driver, processed_bid_ids):
+def process_bid_categories():
     """
-    Iterates through specified bid categories and scrapes data from each.
+    Scrapes every bid category of every site in parallel, one browser process
+    per category. The workers push each scraped bid onto a shared queue that a
+    background thread writes to Excel; Bid IDs are recorded as processed only
+    once they are saved.
     """
-    wait = WebDriverWait(driver, 15)
+    # Open the workbook up front, so an unreadable Excel file stops the run before scraping
+    book, sheet, headers = open_workbook(EXCEL_FILE)
+    manager = Manager()
+    row_queue = manager.Queue(maxsize=WRITE_QUEUE_SIZE)
+    writer = threading.Thread(
+        target=excel_writer,
+        args=(row_queue, book, sheet, headers, EXCEL_FILE, PROCESSED_IDS_DB),
+        daemon=True,
+    )
+    writer.start()
+
+    jobs = [(site["url"], category_name, tab_id) for site in SITES for category_name, tab_id in site["categories"]]
+    try:
+        with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {
+                executor.submit(scrape_category, url, category_name, tab_id, PROCESSED_IDS_DB, row_queue): category_name
+                for url, category_name, tab_id in jobs
+            }
+            for future in as_completed(futures):
+                category_name = futures[future]
+                try:
+                    future.result()
+                    logging.info(f"Finished category '{category_name}'.")
+                except Exception as e:
+                    logging.error(f"Could not process category '{category_name}': {e}")
+    finally:
+        stop_excel_writer(writer, row_queue)
+        manager.shutdown()
+
+def stop_excel_writer(writer, row_queue):
+    """
+    Sends the writer its None sentinel and waits for the final save. Does not
+    block forever if the writer has died and the queue is full.
+    """
+    if not writer.is_alive():
+        logging.error("The Excel writer stopped early; recent bids may not be saved.")
+        return
+
+    try:
+        row_queue.put(None, timeout=WRITER_STOP_TIMEOUT)  # Tell the writer to flush and exit
+    except queue.Full:
+        logging.error("Could not stop the Excel writer: its queue stayed full.")
+        return
+    writer.join()
+
+def scrape_category(url, category_name, tab_id, db_file, row_queue):
+    """
+    Worker process entry point: scrapes a single bid category in its own browser,
+    skipping the Bid IDs already recorded in the processed-IDs database.
+    Scraped bids are pushed onto row_queue for the Excel writer.
+    """
+    setup_logging()
+    conn = open_processed_ids_db(db_file)
+    driver = initialize_browser(profile_name=get_profile_name(url, tab_id))
+    setup_interrupt_handler(driver)
+    wait = WebDriverWait(driver, 15, poll_frequency=0.2)
 
-    categories = [("Open","btnOpen"),("Recently Closed","btnClosed"),("Not Awarded","btnNotAwarded")]
-    for category_name, tab_id in categories:
-        logging.info(f"--- Processing category: {category_name} ---")
+    logging.info(f"--- Processing category: {category_name} ---")
+    try:
+        navigate_to_bids_page(driver, url)
+        open_category_tab(driver, wait, tab_id)
+        share_browser_session(driver)
+        tabs = open_browser_tabs(driver, wait, url, tab_id, TABS_PER_CATEGORY)
+        scrape_bids_from_table(driver, wait, tabs, f"{url} {category_name}", category_name, conn, row_queue)
+    except Exception as e:
+        logging.error(f"Could not process category '{category_name}': {e}")
+    finally:
+        driver.quit()
+        finish_document_downloads()
+        conn.close()
+
+def open_category_tab(driver, wait, tab_id):
+    """
+    Clicks a bid category tab and waits for its table to render.
+    """
+    # Let the grid's initial load finish first, so its rows can't be mistaken
+    # for the rows of the category being opened
+    old_rows = wait_for_data_rows(wait)
+    tab = wait.until(EC.element_to_be_clickable((By.ID, tab_id)))
+    if is_tab_active(driver, tab):
+        return  # Already showing this category; clicking would not re-render the table
+
+    tab.click()
+    # Wait for the previous table to be replaced and the new rows to render
+    if old_rows:
         try:
-            wait.until(EC.element_to_be_clickable((By.ID, tab_id))).click()
-            time.sleep(2)  # Allow time for the table to load
-            scrape_bids_from_table(driver, wait, category_name, processed_bid_ids)
-        except Exception as e:
-            logging.error(f"Could not process category '{category_name}': {e}")
+            wait.until(EC.staleness_of(old_rows[0]))
+        except TimeoutException:
+            pass  # The table was not re-rendered after all
+    wait_for_data_rows(wait)
+
+def is_tab_active(driver, tab):
+    """
+    Checks whether a category tab button is the currently selected one.
+    """
+    return driver.execute_script("""
+        var tab = arguments[0];
+        return tab.classList.contains('active') ||
+            tab.getAttribute('aria-pressed') === 'true' ||
+            tab.getAttribute('aria-selected') === 'true';
+    """, tab)
+
+def wait_for_data_rows(wait):
+    """
+    Waits for the grid's data rows and returns them. The permanent jqgfirstrow
+    sizing row is not counted, as it is there before any data arrives.
+    Returns an empty list if the table stays empty.
+    """
+    try:
+        return wait.until(EC.presence_of_all_elements_located(_SEL_DATA_ROWS))
+    except TimeoutException:
+        logging.info("The bids table has no rows.")
+        return []
 
-def scrape_bids_from_table(driver, wait, category_name, processed_bid_ids):
+def open_browser_tabs(driver, wait, url, tab_id, count):
+    """
+    Opens extra browser tabs showing the same bid category, so several detail
+    modals can load at once. Returns the window handles of all tabs.
+    """
+    tabs = [driver.current_window_handle]
+    for _ in range(count - 1):
+        driver.switch_to.new_window("tab")
+        navigate_to_bids_page(driver, url)
+        open_category_tab(driver, wait, tab_id)
+        tabs.append(driver.current_window_handle)
+    driver.switch_to.window(tabs[0])
+    return tabs
+
+def scrape_bids_from_table(driver, wait, tabs, walk_id, category_name, conn, row_queue):
     """
     Scrapes all bid data from the currently active table, handling pagination.
+    Row summaries are read from the grid's JSON backend when it is available,
+    so the browser is only driven for the detail modals and page changes.
+    All tabs are kept on the same page of the table. The rows are already
+    rendered when this is called (open_category_tab waits for them) and after
+    every page change (navigate_to_next_page waits for the old rows to go stale),
+    so the table is read without waiting again.
+    A chronological category stops at the first fully scraped page, but only
+    when the previous walk of it (walk_id) completed; otherwise an interrupted
+    run would leave the older pages it never reached unscraped for good.
+    A pagination failure is raised and leaves the walk incomplete, as does a
+    new bid that couldn't be scraped, so the next run walks back to it.
     """
-    while True:
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "#jqGridBids tbody tr")))
-        rows = driver.find_elements(By.CSS_SELECTOR, "#jqGridBids tbody tr")
+    can_stop_early = start_category_walk(conn, walk_id) and category_name in CHRONOLOGICAL_CATEGORIES
+    grid_request = get_grid_request(driver)
+    seen_bid_ids = set()
+    page = 1
+    all_bids_queued = True
 
-        for row in rows:
-            try:
-                process_bid_row(row, driver, wait, category_name, processed_bid_ids)
-            except Exception as e:
-                logging.error(f"Error processing a bid row: {e}")
-                # Optionally, refresh or take other recovery actions
-                continue
+    while True:
+        driver.switch_to.window(tabs[0])
+        summaries = fetch_grid_page(_session, grid_request, page, category_name) if grid_request else None
+
+        if summaries is None:
+            grid_request = None  # Backend unavailable; read the rendered table from now on
+            summaries = read_table_rows(driver, category_name)
+        elif page == 1:
+            # The JSON values are unformatted; only trust them if they match the rendered table
+            table_rows = read_table_rows(driver, category_name)
+            if summaries[:1] != table_rows[:1]:
+                logging.warning("Grid backend rows don't match the rendered table; reading the table instead.")
+                grid_request = None
+                summaries = table_rows
+
+        new_summaries = filter_new_bids(summaries, conn, seen_bid_ids)
+        if summaries and not new_summaries and can_stop_early:
+            logging.info("Whole page already scraped; the remaining pages hold older bids.")
+            break
+        if not scrape_bid_modals(driver, wait, tabs, new_summaries, row_queue):
+            all_bids_queued = False
 
-        if not navigate_to_next_page(driver):
+        if not navigate_tabs_to_next_page(driver, wait, tabs):
             logging.info("No more pages to scrape in this category.")
             break
+        page += 1
+
+    if all_bids_queued:
+        complete_category_walk(conn, walk_id)
+    else:
+        logging.warning("Some bids could not be scraped; the next run will walk this whole category again.")
+
+def read_table_rows(driver, category_name):
+    """
+    Extracts the summary data of every row in the rendered table with a single
+    script call, instead of one WebDriver round trip per cell.
+    Returns a list of (row_id, bid_summary) tuples; malformed rows are skipped.
+    """
+    rows = driver.execute_script("""
+        return Array.from(document.querySelectorAll(arguments[0])).map(function (row) {
+            var cells = row.querySelectorAll('td');
+            if (cells.length < 7) return null;
+            var values = [cells[0].title];
+            for (var i = 1; i < 7; i++) values.push(cells[i].innerText);
+            return {rowId: row.id, values: values};
+        }).filter(Boolean);
+    """, _SEL_DATA_ROWS[1])
+
+    summaries = []
+    for row in rows:
+        bid_summary = {"Category": category_name}
+        for column, value in zip(GRID_COLUMNS, row["values"]):
+            bid_summary[column] = (value or "").strip()
+        summaries.append((row["rowId"], bid_summary))
+    return summaries
+
+def filter_new_bids(summaries, conn, seen_bid_ids):
+    """
+    Drops the bids that were already scraped in a previous run or already seen
+    in this one, before any modal is opened, so skipped bids cost no WebDriver
+    calls at all.
+    """
+    new_summaries = []
+    for row_id, bid_summary in summaries:
+        bid_id = bid_summary["Bid ID"]
+        if bid_id in seen_bid_ids or is_bid_processed(conn, bid_id):
+            continue
+        seen_bid_ids.add(bid_id)
+        new_summaries.append((row_id, bid_summary))
+    skipped = len(summaries) - len(new_summaries)
+    if skipped:
+        logging.info(f"Skipping {skipped} already scraped bids on this page.")
+    return new_summaries
+
+def scrape_bid_modals(driver, wait, tabs, summaries, row_queue):
+    """
+    Opens and scrapes the detail modals for one page of new bids, pipelined
+    across the browser tabs: while one tab's modal is being scraped, the modals
+    opened in the other tabs are already loading.
+    Returns True if every bid was queued, False if any was skipped or failed.
+    """
+    free_tabs = deque(tabs)
+    open_modals = deque()
+    all_queued = True
+
+    for row_id, bid_summary in summaries:
+        bid_id = bid_summary["Bid ID"]
+        while not free_tabs and open_modals:
+            if not finish_bid_modal(driver, wait, tabs, open_modals, free_tabs, row_queue):
+                all_queued = False
+        if not free_tabs:
+            raise RuntimeError("No browser tab is left to open bid modals in.")
+
+        tab = free_tabs.popleft()
+        driver.switch_to.window(tab)
+        if open_bid_modal(driver, row_id):
+            open_modals.append((tab, row_id, bid_summary))
+        else:
+            logging.warning(f"Bid ID {bid_id} is not on the current page. Skipping.")
+            free_tabs.append(tab)
+            all_queued = False
 
-def process_bid_row(row, driver, wait, category_name, processed_bid_ids):
+    while open_modals:
+        if not finish_bid_modal(driver, wait, tabs, open_modals, free_tabs, row_queue):
+            all_queued = False
+    return all_queued
+
+def finish_bid_modal(driver, wait, tabs, open_modals, free_tabs, row_queue):
     """
-    Extracts data from a single row, opens the details modal, scrapes modal data,
-    and saves the combined information.
+    Scrapes the oldest open modal and returns its tab to the pool of free tabs.
+    If the modal or grid re-renders mid-scrape, the modal is looked up again
+    (and reopened from its row id if it closed) instead of abandoning the bid.
+    After a failure the modal is closed before the tab is reused, so the next
+    bid can't read this one's dialog; a tab whose modal won't close is removed
+    from tabs for the rest of the category.
+    Returns True if the bid was queued, False if it failed.
     """
-    cells = row.find_elements(By.TAG_NAME, "td")
-    if len(cells) < 7:
-        return  # Skip malformed rows
+    tab, row_id, bid_summary = open_modals.popleft()
+    driver.switch_to.window(tab)
+    try:
+        for attempt in range(2):
+            try:
+                scrape_bid_modal(driver, wait, bid_summary, row_queue)
+                break
+            except StaleElementReferenceException:
+                if attempt:
+                    raise
+                logging.warning(f"Stale element while scraping Bid ID {bid_summary['Bid ID']}. Retrying.")
+                modals = driver.find_elements(*_SEL_MODAL)
+                if not (modals and modals[0].is_displayed()):
+                    open_bid_modal(driver, row_id)
+        free_tabs.append(tab)
+        return True
+    except Exception as e:
+        logging.error(f"Error processing Bid ID {bid_summary['Bid ID']}: {e}")
 
-    bid_id = cells[0].get_attribute("title")
-    if str(bid_id) in processed_bid_ids:
-        logging.info(f"Skipping already scraped Bid ID: {bid_id}")
-        return
+    try:
+        close_bid_modal(driver, wait)
+        free_tabs.append(tab)
+    except Exception as e:
+        logging.error(f"Could not close the details modal, dropping its browser tab: {e}")
+        tabs.remove(tab)
+    return False
 
-    # Extract data from the main table row
-    bid_summary = {
-        "Category": category_name,
-        "Bid ID": bid_id,
-        "Contract Number": cells[1].text.strip(),
-        "Title": cells[2].text.strip(),
-        "Open Date": cells[3].text.strip(),
-        "Deadline": cells[4].text.strip(),
-        "Agency": cells[5].text.strip(),
-        "UNSPSC": cells[6].text.strip(),
-    }
+def open_bid_modal(driver, row_id):
+    """
+    Clicks the title link of the grid row with the given id.
+    Returns True if the link was found and clicked, False otherwise.
+    """
+    return driver.execute_script("""
+        var row = document.getElementById(arguments[0]);
+        var cells = row ? row.getElementsByTagName('td') : [];
+        var link = cells.length > 2 ? cells[2].querySelector('a') : null;
+        if (link) link.click();
+        return !!link;
+    """, row_id)
+
+def scrape_bid_modal(driver, wait, bid_summary, row_queue):
+    """
+    Scrapes the currently opening details modal, closes it, and queues the bid
+    summary combined with the modal data for the Excel writer.
+    """
+    bid_id = bid_summary["Bid ID"]
 
-    # Open the details modal
-    title_link = cells[2].find_element(By.TAG_NAME, "a")
-    driver.execute_script("arguments[0].click();", title_link)
-    
     # Scrape data from the modal
-    modal = wait.until(EC.presence_of_element_located((By.ID, "dynamicDialogInnerHtml")))
-    modal_data = extract_modal_data(modal)
+    modal = wait.until(EC.visibility_of_element_located(_SEL_MODAL))
+    modal_data = extract_modal_data(driver, modal)
+    documents = modal_data["Documents"]
 
-    # Close the modal
-    ActionChains(driver).send_keys(u'\ue00c').perform() # Simulates pressing the Escape key
-    time.sleep(1)
+    close_bid_modal(driver, wait)
 
-    # Combine and save data
+    if DOWNLOAD_DOCUMENTS and documents:
+        download_bid_documents(bid_id, documents)  # Queued; doesn't wait for the downloads
+
+    # Combine and queue data; the writer thread saves it while the next modal loads
+    modal_data["Documents"] = str(documents) if documents else "N/A"
     full_bid_data = {**bid_summary, **modal_data}
-    append_to_excel(full_bid_data, EXCEL_FILE)
-    processed_bid_ids.add(str(bid_id))
-    logging.info(f"Successfully scraped and saved Bid ID: {bid_id}")
+    row_queue.put(full_bid_data)
+    logging.info(f"Successfully scraped Bid ID: {bid_id}")
 
-def extract_modal_data(modal):
+def close_bid_modal(driver, wait):
     """
-    Extracts detailed information from the bid details modal.
+    Closes the details modal and waits until it is hidden.
     """
-    # Helper function to safely find an element and get its text
-    def get_text(xpath):
-        try:
-            return modal.find_element(By.XPATH, xpath).text.strip()
-        except:
-            return "N/A"
-
-    # Extract document links
-    documents = {}
-    try:
-        doc_links = modal.find_elements(By.XPATH, ".//div[@id='bidDocuments']//a")
-        for link in doc_links:
-            documents[link.text.strip()] = link.get_attribute("href")
-    except Exception as e:
-        logging.warning(f"Could not extract document links: {e}")
+    # Close the modal through Bootstrap directly; fall back to pressing Escape
+    closed = driver.execute_script("""
+        var dialog = window.jQuery ? jQuery('#dynamicDialog') : null;
+        if (!dialog || !dialog.length || !dialog.modal) return false;
+        dialog.modal('hide');
+        return true;
+    """)
+    if not closed:
+        ActionChains(driver).send_keys(u'\ue00c').perform() # Simulates pressing the Escape key
+    wait.until(EC.invisibility_of_element_located(_SEL_MODAL))
+
+def extract_modal_data(driver, modal):
+    """
+    Extracts detailed information from the bid details modal with a single
+    script call that returns every field and the document links at once.
+    "Documents" is returned as a {name: url} dict.
+    """
+    data = driver.execute_script("""
+        var modal = arguments[0];
+        function text(el) { return el && el.innerText.trim() ? el.innerText.trim() : 'N/A'; }
+        function labelAfter(caption) {
+            var label = Array.from(modal.querySelectorAll('label')).find(function (l) {
+                return l.textContent.indexOf(caption) !== -1;
+            });
+            return text(label ? label.nextElementSibling : null);
+        }
+        var documents = {};
+        modal.querySelectorAll('#bidDocuments a').forEach(function (a) {
+            documents[a.innerText.trim()] = a.href;
+        });
+        return {
+            email: text(modal.querySelector("a[href*='mailto']")),
+            solicitation: labelAfter('Solicitation Ad Date'),
+            deadline: labelAfter('Deadline for Bid Responses'),
+            message: text(modal.querySelector('h6.text-danger')),
+            documents: documents
+        };
+    """, modal)
 
     return {
-        "Contact Email": get_text(".//a[contains(@href, 'mailto')]"),
-        "Solicitation Ad Date": get_text(".//label[preceding-sibling::label[contains(text(),'Solicitation Ad Date')]]"),
-        "Deadline for Bid Responses": get_text(".//label[preceding-sibling::label[contains(text(),'Deadline for Bid Responses')]]"),
-        "Important Message": get_text(".//h6[contains(@class, 'text-danger')]"),
-        "Documents": str(documents) if documents else "N/A"
+        "Contact Email": data["email"],
+        "Solicitation Ad Date": data["solicitation"],
+        "Deadline for Bid Responses": data["deadline"],
+        "Important Message": data["message"],
+        "Documents": data["documents"]
     }
 
-def navigate_to_next_page(driver):
+def download_bid_documents(bid_id, documents):
+    """
+    Queues a bid's documents for download into DOCUMENTS_DIR/<Bid ID>/ on the
+    process's download pool and returns immediately, so the next modal is
+    scraped while they download over the shared HTTP session's connections.
+    """
+    global _download_executor
+    if _download_executor is None:
+        _download_executor = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+
+    bid_dir = os.path.join(DOCUMENTS_DIR, safe_filename(bid_id))
+    os.makedirs(bid_dir, exist_ok=True)
+    for name, url in documents.items():
+        _download_executor.submit(download_document, url, os.path.join(bid_dir, safe_filename(name)))
+
+def finish_document_downloads():
+    """
+    Waits for the queued document downloads to finish and releases the pool.
+    """
+    global _download_executor
+    if _download_executor is not None:
+        _download_executor.shutdown(wait=True)
+        _download_executor = None
+
+def download_document(url, path):
     """
-    Clicks the 'next' button on the pagination control if it's available.
-    Returns True if successful, False otherwise.
+    Streams a single document to disk. Failures are logged, not raised.
     """
     try:
-        next_btn = driver.find_element(By.ID, "next_jqg1")
-        if "disabled" in next_btn.get_attribute("class") or \
-           "ui-jqgrid-disablePointerEvents" in next_btn.get_attribute("class"):
+        with _session.get(url, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            with open(path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
+    except (requests.RequestException, OSError) as e:
+        logging.warning(f"Could not download document '{url}': {e}")
+
+def safe_filename(name):
+    """
+    Replaces characters that are not allowed in file names.
+    """
+    return re.sub(r'[\\/:*?"<>|]+', "_", str(name)).strip() or "document"
+
+# --- Grid Backend ---
+
+def get_grid_request(driver):
+    """
+    Reads the request the jqGrid uses to load the bids table (URL, HTTP method,
+    post data and column model). Returns None if the grid isn't backed by a
+    JSON endpoint, in which case the rendered table is scraped instead.
+    """
+    return driver.execute_script("""
+        var grid = window.jQuery ? jQuery('#jqGridBids') : null;
+        if (!grid || !grid.length || !grid.jqGrid) return null;
+        var p = grid.jqGrid('getGridParam');
+        if (!p || !p.url || p.datatype !== 'json') return null;
+        var params = {};
+        Object.keys(p.postData || {}).forEach(function (key) {
+            var value = p.postData[key];
+            params[key] = typeof value === 'function' ? value() : value;
+        });
+        return {
+            url: new URL(p.url, window.location.href).href,
+            method: (p.mtype || 'GET').toUpperCase(),
+            params: params,
+            pageParam: (p.prmNames && p.prmNames.page) || 'page',
+            columns: p.colModel.map(function (c) { return {name: c.name, hidden: !!c.hidden}; })
+        };
+    """)
+
+def share_browser_session(driver):
+    """
+    Copies the browser's cookies and user agent into the shared HTTP session,
+    so the site serves it the same data it serves the browser.
+    """
+    _session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+    _session.headers["X-Requested-With"] = "XMLHttpRequest"
+    _session.cookies.update({c["name"]: c["value"] for c in driver.get_cookies()})
+
+def fetch_grid_page(session, grid_request, page, category_name):
+    """
+    Fetches one page of the bids grid from its JSON backend.
+    Returns a list of (row_id, bid_summary) tuples, or None if the request fails.
+    """
+    params = {**grid_request["params"], grid_request["pageParam"]: page}
+    try:
+        if grid_request["method"] == "POST":
+            response = session.post(grid_request["url"], data=params, timeout=30)
+        else:
+            response = session.get(grid_request["url"], params=params, timeout=30)
+        response.raise_for_status()
+        grid_rows = response.json()["rows"]
+    except (requests.RequestException, ValueError, KeyError, TypeError) as e:
+        logging.warning(f"Grid backend request failed, reading the table instead: {e}")
+        return None
+
+    # jqGrid's row number, checkbox and subgrid columns have no server data,
+    # and only the visible data columns are rendered as the summary columns
+    data_columns = [column for column in grid_request["columns"] if column["name"] not in ("rn", "cb", "subgrid")]
+    columns = [(index, column["name"]) for index, column in enumerate(data_columns)
+               if not column["hidden"]][:len(GRID_COLUMNS)]
+    summaries = []
+    for grid_row in grid_rows:
+        summary = parse_grid_row(grid_row, columns, category_name)
+        if summary:
+            summaries.append(summary)
+    return summaries
+
+def parse_grid_row(grid_row, columns, category_name):
+    """
+    Maps a jqGrid JSON row onto the summary columns of the bids table, given
+    the (cell index, name) of each visible data column.
+    Rows come either as {"id": ..., "cell": [...]} or as objects keyed by
+    column name. Returns a (row_id, bid_summary) tuple, or None if malformed.
+    """
+    if len(columns) < len(GRID_COLUMNS):
+        return None  # The column model doesn't cover the summary columns
+    if isinstance(grid_row, dict) and "cell" not in grid_row:
+        values = [grid_row.get(name) for _, name in columns]
+        row_id = grid_row.get("id")
+    else:
+        if isinstance(grid_row, dict):
+            cells, row_id = grid_row["cell"], grid_row.get("id")
+        else:
+            cells, row_id = grid_row, None
+        if len(cells) <= columns[-1][0]:
+            return None  # Skip malformed rows
+        values = [cells[index] for index, _ in columns]
+
+    bid_summary = {"Category": category_name}
+    for column, value in zip(GRID_COLUMNS, values):
+        bid_summary[column] = "" if value is None else str(value).strip()
+    return str(row_id if row_id is not None else bid_summary["Bid ID"]), bid_summary
+
+# --- Pagination ---
+
+def navigate_tabs_to_next_page(driver, wait, tabs):
+    """
+    Moves every browser tab to the next page of the table.
+    Returns True if successful, or False if the tabs are on the last page.
+    Raises if pagination fails, so a failure isn't taken for the end of the table.
+    """
+    for tab in tabs:
+        driver.switch_to.window(tab)
+        if not navigate_to_next_page(driver, wait):
             return False
-        
-        driver.execute_script("arguments[0].click();", next_btn)
-        time.sleep(2) # Wait for the next page to load
-        return True
-    except Exception as e:
-        logging.error(f"Pagination failed or reached the end: {e}")
+    return True
+
+def navigate_to_next_page(driver, wait):
+    """
+    Clicks the 'next' button on the pagination control if it's available and
+    waits for the current rows to be replaced.
+    Returns True if successful, or False if the table is on its last page.
+    Any other failure (a missing button, a page that doesn't load) is raised.
+    """
+    # Check the button state, remember the first row and click in one round trip.
+    # Returns null if there is no button, false if there is no next page,
+    # otherwise the first row (or true if empty).
+    first_row = driver.execute_script("""
+        var next = document.getElementById(arguments[0]);
+        if (!next) return null;
+        var cls = next.className;
+        if (cls.indexOf('disabled') !== -1 || cls.indexOf('ui-jqgrid-disablePointerEvents') !== -1) return false;
+        var firstRow = document.querySelector(arguments[1]);
+        next.click();
+        return firstRow || true;
+    """, _SEL_NEXT[1], _SEL_DATA_ROWS[1])
+    if first_row is None:
+        raise NoSuchElementException(f"Pagination button '{_SEL_NEXT[1]}' not found.")
+    if first_row is False:
         return False
 
+    if first_row is not True:
+        wait.until(EC.staleness_of(first_row)) # Wait for the next page to load
+    return True
+
 # --- Entry Point ---
 
 if __name__ == "__main__":